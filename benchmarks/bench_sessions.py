@@ -0,0 +1,70 @@
+import asyncio
+import os
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot.sessions import ChatSession, SessionScheduler
+
+CHATS = 100_000
+PRICES = {'SOL': 142.17, 'ETH': 2431.55, 'BTC': 61234.9}
+
+async def noop_update(bot, session):
+    pass
+
+async def legacy_price_task(previous_prices: dict):
+    while True:
+        await asyncio.sleep(10)
+
+def legacy_layout(count: int):
+    active_tasks = {}
+    for chat_id in range(count):
+        previous_prices = {ticker: price + chat_id for ticker, price in PRICES.items()}
+        task = asyncio.create_task(legacy_price_task(previous_prices))
+        active_tasks[chat_id] = {'task': task, 'message_id': chat_id}
+    return active_tasks
+
+def session_layout(count: int):
+    scheduler = SessionScheduler(noop_update)
+    for chat_id in range(count):
+        session = ChatSession(chat_id, chat_id, chat_id % scheduler.slots_count)
+        session.store_prices({ticker: price + chat_id for ticker, price in PRICES.items()})
+        scheduler.sessions[chat_id] = session
+        scheduler.wheel[session.slot].add(chat_id)
+    return scheduler
+
+async def measure(build, count: int):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build(count)
+    await asyncio.sleep(0)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if isinstance(kept, dict):
+        for entry in kept.values():
+            entry['task'].cancel()
+        await asyncio.gather(*(entry['task'] for entry in kept.values()), return_exceptions=True)
+    return (after - before) / count
+
+async def measure_tick(count: int) -> tuple[int, float]:
+    scheduler = session_layout(count)
+    scheduler.semaphore = asyncio.Semaphore(scheduler.max_concurrent)
+    scheduler.current_slot = scheduler.slots_count - 1
+    started = perf_counter()
+    due = scheduler.advance()
+    await asyncio.gather(*scheduler.running.values())
+    return due, (perf_counter() - started) * 1000
+
+async def main():
+    print(f"chats: {CHATS}, tickers per chat: {len(PRICES)}")
+    print(f"per-chat tasks + dicts:          {await measure(legacy_layout, CHATS):.0f} bytes/chat")
+    print(f"slotted sessions + timing wheel: {await measure(session_layout, CHATS):.0f} bytes/chat")
+    for count in (CHATS // 10, CHATS):
+        due, elapsed = await measure_tick(count)
+        print(f"wheel tick at {count} chats ({due} due, updates included): "
+              f"{elapsed:.2f} ms, {elapsed * 1000 / due:.2f} us/chat")
+
+if __name__ == '__main__':
+    asyncio.run(main())
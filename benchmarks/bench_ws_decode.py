@@ -0,0 +1,70 @@
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bot import crypto_api
+from bot.crypto_api import apply_mini_ticker_frame, apply_ticker_message, ws_stats
+
+MARKET_SYMBOLS = 400
+TRACKED = 20
+SECONDS = 600
+
+def market_bases(count: int) -> list:
+    return [f"C{index:03d}" for index in range(count)]
+
+def ticker_message(symbol: str, price: float) -> str:
+    return json.dumps({
+        'e': '24hrTicker', 's': symbol, 'c': f"{price:.4f}", 'P': '1.250',
+        'h': f"{price * 1.02:.4f}", 'l': f"{price * 0.98:.4f}", 'q': '123456.78'
+    })
+
+def mini_ticker_frame(symbols: list, prices: dict) -> str:
+    return json.dumps([
+        {
+            'e': '24hrMiniTicker', 's': symbol, 'c': f"{prices[symbol]:.4f}", 'o': f"{prices[symbol] * 0.99:.4f}",
+            'h': f"{prices[symbol] * 1.02:.4f}", 'l': f"{prices[symbol] * 0.98:.4f}", 'v': '1000.0', 'q': '123456.78'
+        }
+        for symbol in symbols
+    ])
+
+def reset_state(tracked: list) -> None:
+    crypto_api.price_cache.clear()
+    crypto_api.stats_cache.clear()
+    crypto_api.quote_symbols.clear()
+    crypto_api.usdc_bases.clear()
+    crypto_api.subscriptions.clear()
+    crypto_api.subscriptions.update(tracked)
+    for stats in ws_stats.values():
+        stats.update({'frames': 0, 'ticks': 0, 'tracked': 0, 'cpu_seconds': 0.0})
+
+def main():
+    random.seed(1)
+    bases = market_bases(MARKET_SYMBOLS)
+    tracked = bases[:TRACKED]
+    symbols = [f"{base}{random.choice(('USDC', 'USDT'))}" for base in bases]
+    prices = {symbol: random.uniform(0.01, 50000) for symbol in symbols}
+    per_symbol = [[ticker_message(f"{base}USDC", prices.get(f"{base}USDC", 1.0)) for base in tracked] for _ in range(SECONDS)]
+    frames = [mini_ticker_frame(random.sample(symbols, MARKET_SYMBOLS // 2), prices) for _ in range(SECONDS)]
+
+    reset_state(tracked)
+    for messages in per_symbol:
+        for message in messages:
+            apply_ticker_message(message)
+    ticker = dict(ws_stats['ticker'])
+    reset_state(tracked)
+    for frame in frames:
+        apply_mini_ticker_frame(frame)
+    mini = dict(ws_stats['miniticker'])
+
+    print(f"tracked coins: {TRACKED}, market symbols: {MARKET_SYMBOLS}, simulated seconds: {SECONDS}, decoder: {crypto_api.json_loads.__module__}")
+    for name, stats in (('per-symbol @ticker', ticker), ('!miniTicker@arr', mini)):
+        per_second = stats['cpu_seconds'] / SECONDS * 1e6
+        per_update = stats['cpu_seconds'] / max(stats['tracked'], 1) * 1e6
+        print(f"{name:20} frames={stats['frames']:6d} ticks={stats['ticks']:7d} tracked={stats['tracked']:6d} "
+              f"cpu/s={per_second:8.1f}us cpu/tracked update={per_update:6.2f}us")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+from time import time
+from aiogram import Bot
+from aiogram.enums import ChatMemberStatus
+
+ADMIN_CACHE_TIMEOUT = 300
+PINNED_CACHE_TIMEOUT = 600
+
+admin_cache = {}
+pinned_cache = {}
+bot_info_cache = {}
+
+async def get_bot_info(bot: Bot):
+    bot_info = bot_info_cache.get(bot.id)
+    if bot_info is None:
+        bot_info = await bot.get_me()
+        bot_info_cache[bot.id] = bot_info
+    return bot_info
+
+async def get_chat_admins(bot: Bot, chat_id: int) -> set:
+    cache = admin_cache.get(chat_id)
+    if cache is not None and (time() - cache['timestamp']) < ADMIN_CACHE_TIMEOUT:
+        return cache['admins']
+    members = await bot.get_chat_administrators(chat_id)
+    admins = {
+        member.user.id for member in members
+        if member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.CREATOR]
+    }
+    admin_cache[chat_id] = {'admins': admins, 'timestamp': time()}
+    return admins
+
+def invalidate_chat_admins(chat_id: int) -> None:
+    admin_cache.pop(chat_id, None)
+
+async def get_pinned_message(bot: Bot, chat_id: int):
+    cache = pinned_cache.get(chat_id)
+    if cache is not None and (time() - cache['timestamp']) < PINNED_CACHE_TIMEOUT:
+        return cache['pinned']
+    chat = await bot.get_chat(chat_id)
+    pinned = None
+    if chat.pinned_message:
+        from_user_id = chat.pinned_message.from_user.id if chat.pinned_message.from_user else None
+        pinned = {'message_id': chat.pinned_message.message_id, 'from_user_id': from_user_id}
+    pinned_cache[chat_id] = {'pinned': pinned, 'timestamp': time()}
+    return pinned
+
+def set_pinned_message(chat_id: int, message_id: int, from_user_id: int = None) -> None:
+    pinned_cache[chat_id] = {
+        'pinned': {'message_id': message_id, 'from_user_id': from_user_id},
+        'timestamp': time()
+    }
+
+def invalidate_pinned_message(chat_id: int) -> None:
+    pinned_cache.pop(chat_id, None)
+
+def forget_chat(chat_id: int) -> None:
+    admin_cache.pop(chat_id, None)
+    pinned_cache.pop(chat_id, None)
@@ -1,16 +1,26 @@
 import datetime
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 import io
 import aiohttp
 import asyncio
 import json
+import logging
 import websockets
 from aiogram import html
 from collections import defaultdict
-from time import time
+from time import time, perf_counter
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.binance.com"
 WS_URL = "wss://stream.binance.com:9443/ws"
+MINI_TICKER_STREAM = "!miniTicker@arr"
 
 BINANCE_INTERVALS = {
     'd': '1d',
@@ -20,27 +30,137 @@ BINANCE_INTERVALS = {
 
 price_cache = defaultdict(lambda: {'price': None, 'timestamp': 0})
 subscriptions = set()
-CACHE_TIMEOUT = 60
+subscription_state = {'version': 0}
+usdc_bases = set()
+quote_symbols = {}
+PRICE_SLA = 15
+
+rest_stats = {'requests': 0, 'symbols': 0, 'failures': 0}
+rest_breaker = {'failures': 0, 'open_until': 0}
+REST_BREAKER_THRESHOLD = 3
+REST_BACKOFF_BASE = 5
+REST_BACKOFF_MAX = 300
+REST_REQUEST_TIMEOUT = 5
+rest_inflight = {}
+
+quote_ages = {'<1s': 0, '<5s': 0, '<sla': 0, 'stale': 0}
+PRICE_REPORT_INTERVAL = 60
+
+stats_cache = {}
+stats_fetch = {'retry_at': 0}
+stats_inflight = {}
+STATS_CACHE_TIMEOUT = 10
+STATS_REQUEST_TIMEOUT = 3
+STATS_WAIT = 1
+
+ws_stats = {mode: {'frames': 0, 'ticks': 0, 'tracked': 0, 'cpu_seconds': 0.0} for mode in ('ticker', 'miniticker')}
+
+CHART_SIZE = (10, 5)
+CHART_CACHE_SIZE = 512
+CHART_CACHE_TIMEOUT = 60
+chart_cache = {}
+
+def record_ws_stats(mode: str, ticks: int, tracked: int, started: float) -> None:
+    stats = ws_stats[mode]
+    stats['frames'] += 1
+    stats['ticks'] += ticks
+    stats['tracked'] += tracked
+    stats['cpu_seconds'] += perf_counter() - started
+
+def stream_symbol(ticker: str) -> str:
+    return quote_symbols.get(ticker, f"{ticker}USDC")
 
-async def websocket_manager():
+def apply_ticker_message(message) -> int:
+    started = perf_counter()
+    data = json_loads(message)
+    ticks = 0
+    if 's' in data and 'c' in data:
+        symbol = data['s'][:-4].upper()
+        if symbol in subscriptions and data['s'] == stream_symbol(symbol):
+            now = time()
+            price = float(data['c'])
+            price_cache[symbol] = {'price': price, 'timestamp': now, 'source': 'stream'}
+            quote_symbols[symbol] = data['s']
+            if 'P' in data:
+                stats_cache[symbol] = {
+                    'change_percent': float(data['P']),
+                    'high': float(data['h']),
+                    'low': float(data['l']),
+                    'volume': float(data['q']),
+                    'timestamp': now
+                }
+            ticks = 1
+    record_ws_stats('ticker', ticks, ticks, started)
+    return ticks
+
+def apply_mini_ticker_frame(message) -> int:
+    started = perf_counter()
+    data = json_loads(message)
+    now = time()
+    updates = {}
+    stats_updates = {}
+    for item in data:
+        symbol = item['s']
+        if symbol.endswith('USDC'):
+            base = symbol[:-4]
+            usdc_bases.add(base)
+        elif symbol.endswith('USDT'):
+            base = symbol[:-4]
+            if base in usdc_bases:
+                continue
+        else:
+            continue
+        price = float(item['c'])
+        updates[base] = {'price': price, 'timestamp': now, 'source': 'stream'}
+        if base in subscriptions:
+            quote_symbols[base] = symbol
+            open_price = float(item['o'])
+            stats_updates[base] = {
+                'change_percent': (price - open_price) / open_price * 100 if open_price else 0.0,
+                'high': float(item['h']),
+                'low': float(item['l']),
+                'volume': float(item['q']),
+                'timestamp': now
+            }
+    price_cache.update(updates)
+    stats_cache.update(stats_updates)
+    record_ws_stats('miniticker', len(updates), len(stats_updates), started)
+    return len(updates)
+
+async def ticker_stream():
+    async with websockets.connect(WS_URL) as ws:
+        streamed = set()
+        request_id = 0
+        version = None
+        while True:
+            if version != subscription_state['version']:
+                version = subscription_state['version']
+                wanted = {f"{stream_symbol(ticker).lower()}@ticker" for ticker in subscriptions}
+                for method, streams in (("SUBSCRIBE", wanted - streamed), ("UNSUBSCRIBE", streamed - wanted)):
+                    if streams:
+                        request_id += 1
+                        await ws.send(json.dumps({
+                            "method": method,
+                            "params": sorted(streams),
+                            "id": request_id
+                        }))
+                streamed = wanted
+            try:
+                message = await asyncio.wait_for(ws.recv(), timeout=1)
+            except asyncio.TimeoutError:
+                continue
+            apply_ticker_message(message)
+
+async def mini_ticker_stream():
+    async with websockets.connect(f"{WS_URL}/{MINI_TICKER_STREAM}") as ws:
+        async for message in ws:
+            apply_mini_ticker_frame(message)
+
+async def websocket_manager(mode: str = 'ticker'):
+    stream = mini_ticker_stream if mode == 'miniticker' else ticker_stream
     while True:
         try:
-            async with websockets.connect(WS_URL) as ws:
-                while True:
-                    if subscriptions:
-                        subscribe_msg = {
-                            "method": "SUBSCRIBE",
-                            "params": [f"{ticker.lower()}usdc@ticker" for ticker in subscriptions],
-                            "id": 1
-                        }
-                        await ws.send(json.dumps(subscribe_msg))
-                    message = await ws.recv()
-                    data = json.loads(message)
-                    if 's' in data and 'c' in data:
-                        symbol = data['s'].replace('USDC', '').upper()
-                        if symbol in subscriptions:
-                            price = float(data['c'])
-                            price_cache[symbol] = {'price': price, 'timestamp': time()}
+            await stream()
         except Exception:
             await asyncio.sleep(5)
 
@@ -48,56 +168,237 @@ async def subscribe_ticker(ticker: str):
     ticker = ticker.upper()
     if ticker not in subscriptions:
         subscriptions.add(ticker)
-        price_cache[ticker] = {'price': None, 'timestamp': 0}
+        if ticker not in price_cache:
+            price_cache[ticker] = {'price': None, 'timestamp': 0}
+        subscription_state['version'] += 1
 
 async def unsubscribe_ticker(ticker: str):
     ticker = ticker.upper()
-    subscriptions.discard(ticker)
+    if ticker in subscriptions:
+        subscriptions.discard(ticker)
+        subscription_state['version'] += 1
     price_cache.pop(ticker, None)
+    stats_cache.pop(ticker, None)
 
-async def get_current_price(tickers: list, currency: str = 'USDC', force_refresh: bool = False):
-    if isinstance(tickers, str):
-        tickers = [tickers]
+async def subscribe_tickers(tickers: list):
+    tickers = [ticker.upper() for ticker in tickers]
+    new = [ticker for ticker in tickers if ticker not in subscriptions]
+    for ticker in new:
+        if ticker not in price_cache:
+            price_cache[ticker] = {'price': None, 'timestamp': 0}
+    if new:
+        subscriptions.update(new)
+        subscription_state['version'] += 1
+
+async def unsubscribe_tickers(tickers: list):
     tickers = [ticker.upper() for ticker in tickers]
+    if not subscriptions.isdisjoint(tickers):
+        subscriptions.difference_update(tickers)
+        subscription_state['version'] += 1
     for ticker in tickers:
-        await subscribe_ticker(ticker)
+        price_cache.pop(ticker, None)
+        stats_cache.pop(ticker, None)
+
+def set_price_sla(seconds: float) -> None:
+    global PRICE_SLA
+    PRICE_SLA = seconds
+
+def rest_breaker_open() -> bool:
+    return time() < rest_breaker['open_until']
+
+def record_rest_result(ok: bool) -> None:
+    if ok:
+        rest_breaker['failures'] = 0
+        rest_breaker['open_until'] = 0
+        return
+    rest_stats['failures'] += 1
+    rest_breaker['failures'] += 1
+    if rest_breaker['failures'] >= REST_BREAKER_THRESHOLD:
+        backoff = REST_BACKOFF_BASE * (2 ** (rest_breaker['failures'] - REST_BREAKER_THRESHOLD))
+        rest_breaker['open_until'] = time() + min(backoff, REST_BACKOFF_MAX)
+
+async def fetch_rest_prices(tickers: list, currency: str = 'USDC') -> dict:
+    url = f"{BASE_URL}/api/v3/ticker/price"
+    params = None
+    if all(ticker in quote_symbols for ticker in tickers):
+        params = {'symbols': json.dumps([quote_symbols[ticker] for ticker in tickers], separators=(',', ':'))}
+    rest_stats['symbols'] += len(tickers)
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=REST_REQUEST_TIMEOUT)) as session:
+        while True:
+            rest_stats['requests'] += 1
+            async with session.get(url, params=params) as response:
+                if response.status == 400 and params is not None:
+                    params = None
+                    continue
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                data = await response.json()
+                break
+    price_map = {item['symbol']: float(item['price']) for item in data}
+    current_time = time()
     result = {}
-    missing = []
+    for ticker in tickers:
+        for symbol in (quote_symbols.get(ticker), f"{ticker}{currency.upper()}", f"{ticker}USDT"):
+            if symbol in price_map:
+                result[ticker] = price_map[symbol]
+                price_cache[ticker] = {'price': price_map[symbol], 'timestamp': current_time, 'source': 'rest'}
+                if quote_symbols.get(ticker) != symbol:
+                    quote_symbols[ticker] = symbol
+                    if ticker in subscriptions:
+                        subscription_state['version'] += 1
+                break
+        else:
+            result[ticker] = None
+    return result
+
+async def refresh_rest_prices(tickers: list, currency: str = 'USDC') -> dict:
+    task = asyncio.current_task()
+    try:
+        prices = await fetch_rest_prices(tickers, currency)
+    except Exception:
+        record_rest_result(False)
+        raise
+    finally:
+        for ticker in tickers:
+            if rest_inflight.get(ticker) is task:
+                rest_inflight.pop(ticker, None)
+    record_rest_result(True)
+    return prices
+
+async def get_price_quotes(tickers: list, currency: str = 'USDC', force_refresh: bool = False):
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    tickers = [ticker.upper() for ticker in tickers]
+    quotes = {}
+    stale = []
     current_time = time()
     for ticker in tickers:
         cache = price_cache.get(ticker, {'price': None, 'timestamp': 0})
-        if not force_refresh and cache['price'] is not None and (current_time - cache['timestamp']) < CACHE_TIMEOUT:
-            result[ticker] = cache['price']
+        if cache['price'] is not None:
+            age = current_time - cache['timestamp']
+            quotes[ticker] = {'price': cache['price'], 'age': age, 'stale': age >= PRICE_SLA, 'source': cache.get('source', 'rest')}
+            if not force_refresh and not quotes[ticker]['stale']:
+                continue
+        stale.append(ticker)
+    if not stale:
+        record_quote_ages(quotes.values())
+        return quotes, None
+    to_fetch = [ticker for ticker in stale if ticker not in rest_inflight]
+    if to_fetch and not rest_breaker_open():
+        task = asyncio.create_task(refresh_rest_prices(to_fetch, currency))
+        for ticker in to_fetch:
+            rest_inflight[ticker] = task
+    tasks = {rest_inflight[ticker] for ticker in stale if ticker in rest_inflight}
+    prices = {}
+    failure = None
+    for outcome in await asyncio.gather(*(asyncio.shield(task) for task in tasks), return_exceptions=True):
+        if isinstance(outcome, Exception):
+            failure = outcome
         else:
-            missing.append(ticker)
-            price_cache[ticker] = {'price': None, 'timestamp': 0}
-    if missing:
-        symbols = [f"{ticker}{currency.upper()}" for ticker in missing]
-        url = f"{BASE_URL}/api/v3/ticker/price"
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return {ticker: None for ticker in tickers}, f"Error fetching prices: HTTP {response.status}"
-                    data = await response.json()
-                    price_map = {item['symbol']: float(item['price']) for item in data}
-                    for ticker, symbol in zip(missing, symbols):
-                        if symbol in price_map:
-                            result[ticker] = price_map[symbol]
-                            price_cache[ticker] = {'price': price_map[symbol], 'timestamp': current_time}
-                        else:
-                            usdt_symbol = f"{ticker}USDT"
-                            if usdt_symbol in price_map:
-                                result[ticker] = price_map[usdt_symbol]
-                                price_cache[ticker] = {'price': price_map[usdt_symbol], 'timestamp': current_time}
-                            else:
-                                result[ticker] = None
-                    return result, None
-        except Exception as e:
-            return {ticker: None for ticker in tickers}, f"Error retrieving prices: {str(e)}"
-    return result, None
-
-async def get_crypto_price(ticker: str, time_period: str, currency: str = 'USDC'):
+            prices.update(outcome)
+    for ticker in stale:
+        if ticker not in prices:
+            continue
+        if prices[ticker] is None:
+            quotes.pop(ticker, None)
+        else:
+            quotes[ticker] = {'price': prices[ticker], 'age': 0.0, 'stale': False, 'source': 'rest'}
+    if any(ticker not in prices for ticker in stale) and not all(ticker in quotes for ticker in tickers):
+        if failure is not None:
+            return quotes, f"Error retrieving prices: {str(failure)}"
+        return quotes, "Error retrieving prices: Binance REST is cooling down after failures"
+    record_quote_ages(quotes.values())
+    return quotes, None
+
+def record_quote_ages(quotes) -> None:
+    for quote in quotes:
+        if quote['stale']:
+            quote_ages['stale'] += 1
+        elif quote['age'] < 1:
+            quote_ages['<1s'] += 1
+        elif quote['age'] < 5:
+            quote_ages['<5s'] += 1
+        else:
+            quote_ages['<sla'] += 1
+
+def price_source_report() -> dict:
+    return {
+        'rest': dict(rest_stats),
+        'breaker_open': rest_breaker_open(),
+        'quote_ages': dict(quote_ages)
+    }
+
+async def price_source_monitor(interval: float = PRICE_REPORT_INTERVAL):
+    previous = price_source_report()
+    while True:
+        await asyncio.sleep(interval)
+        report = price_source_report()
+        rest = {key: report['rest'][key] - previous['rest'][key] for key in report['rest']}
+        ages = {key: report['quote_ages'][key] - previous['quote_ages'][key] for key in report['quote_ages']}
+        logger.info(
+            "Price source last %.0fs: REST requests=%d symbols=%d failures=%d breaker_open=%s, quote ages %s",
+            interval, rest['requests'], rest['symbols'], rest['failures'], report['breaker_open'], ages
+        )
+        previous = report
+
+async def get_current_price(tickers: list, currency: str = 'USDC', force_refresh: bool = False):
+    if isinstance(tickers, str):
+        tickers = [tickers]
+    tickers = [ticker.upper() for ticker in tickers]
+    quotes, error = await get_price_quotes(tickers, currency, force_refresh)
+    if error:
+        return {ticker: None for ticker in tickers}, error
+    return {ticker: quotes[ticker]['price'] if ticker in quotes else None for ticker in tickers}, None
+
+async def fetch_24h_stats(missing: dict) -> None:
+    url = f"{BASE_URL}/api/v3/ticker/24hr"
+    params = {'symbols': json.dumps(list(missing), separators=(',', ':'))}
+    task = asyncio.current_task()
+    try:
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=STATS_REQUEST_TIMEOUT)) as session:
+            async with session.get(url, params=params) as response:
+                if response.status != 200:
+                    raise Exception(f"HTTP {response.status}")
+                data = await response.json()
+    except Exception:
+        stats_fetch['retry_at'] = time() + STATS_CACHE_TIMEOUT
+        return
+    finally:
+        for ticker in missing.values():
+            if stats_inflight.get(ticker) is task:
+                stats_inflight.pop(ticker, None)
+    current_time = time()
+    for item in data:
+        ticker = missing.get(item['symbol'])
+        if ticker is None:
+            continue
+        stats_cache[ticker] = {
+            'change_percent': float(item['priceChangePercent']),
+            'high': float(item['highPrice']),
+            'low': float(item['lowPrice']),
+            'volume': float(item['quoteVolume']),
+            'timestamp': current_time
+        }
+
+async def get_24h_stats(tickers: list) -> dict:
+    tickers = [ticker.upper() for ticker in tickers]
+    current_time = time()
+    missing = {}
+    for ticker in tickers:
+        cache = stats_cache.get(ticker)
+        if (cache is None or (current_time - cache['timestamp']) >= STATS_CACHE_TIMEOUT) and ticker in quote_symbols:
+            missing[quote_symbols[ticker]] = ticker
+    to_fetch = {symbol: ticker for symbol, ticker in missing.items() if ticker not in stats_inflight}
+    if to_fetch and current_time >= stats_fetch['retry_at']:
+        task = asyncio.create_task(fetch_24h_stats(to_fetch))
+        for ticker in to_fetch.values():
+            stats_inflight[ticker] = task
+    tasks = {stats_inflight[ticker] for ticker in missing.values() if ticker in stats_inflight}
+    if tasks:
+        await asyncio.wait(tasks, timeout=STATS_WAIT)
+    return {ticker: stats_cache[ticker] for ticker in tickers if ticker in stats_cache}
+
+async def get_klines(ticker: str, time_period: str, currency: str = 'USDC'):
     unit = time_period[-1].lower()
     if unit not in BINANCE_INTERVALS:
         return None, f"Invalid time unit. Use {html.bold('d')}, {html.bold('h')}, or {html.bold('m')} (e.g., {html.code('7d')})"
@@ -119,19 +420,44 @@ async def get_crypto_price(ticker: str, time_period: str, currency: str = 'USDC'
         return None, f"Error requesting from Binance: {str(e)}"
     if not data:
         return None, f"No data for {html.bold(ticker)} for the specified period."
+    return data, None
+
+def render_chart(ticker: str, time_period: str, data: list, currency: str = 'USDC') -> bytes:
     dates = [datetime.datetime.fromtimestamp(candle[0] / 1000) for candle in data]
     prices = [float(candle[4]) for candle in data]
-    plt.figure(figsize=(10, 5))
-    plt.plot(dates, prices, label=f'{ticker.upper()} Price')
-    plt.xlabel('Date')
-    plt.ylabel(f'Price ({currency.upper()})')
-    plt.title(f'{ticker.upper()} for {time_period}')
-    plt.xticks(rotation=45)
-    plt.grid(True)
-    plt.legend()
-    plt.tight_layout()
+    fig = Figure(figsize=CHART_SIZE)
+    ax = fig.subplots()
+    ax.plot(dates, prices, label=f'{ticker.upper()} Price')
+    ax.set_xlabel('Date')
+    ax.set_ylabel(f'Price ({currency.upper()})')
+    ax.set_title(f'{ticker.upper()} for {time_period}')
+    ax.tick_params(axis='x', labelrotation=45)
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
     img_buffer = io.BytesIO()
-    plt.savefig(img_buffer, format='png')
-    img_buffer.seek(0)
-    plt.close()
-    return img_buffer, None
\ No newline at end of file
+    fig.savefig(img_buffer, format='png')
+    return img_buffer.getvalue()
+
+def chart_cache_key(ticker: str, time_period: str, data: list, currency: str = 'USDC') -> tuple:
+    symbol = ticker.upper() + currency.upper()
+    interval = f"{int(time_period[:-1])}{BINANCE_INTERVALS[time_period[-1].lower()]}"
+    return symbol, interval, data[-1][0], CHART_SIZE
+
+def get_chart_file_id(key: tuple):
+    entry = chart_cache.get(key)
+    if entry is None:
+        return None
+    if time() - entry['timestamp'] >= CHART_CACHE_TIMEOUT:
+        chart_cache.pop(key, None)
+        return None
+    return entry['file_id']
+
+def store_chart_file_id(key: tuple, file_id: str) -> None:
+    chart_cache.pop(key, None)
+    chart_cache[key] = {'file_id': file_id, 'timestamp': time()}
+    while len(chart_cache) > CHART_CACHE_SIZE:
+        chart_cache.pop(next(iter(chart_cache)))
+
+def forget_chart_file_id(key: tuple) -> None:
+    chart_cache.pop(key, None)
@@ -38,6 +38,46 @@ def remove_ticker(chat_id: int, ticker: str) -> int:
     conn.close()
     return rows_affected
 
+def add_tickers(chat_id: int, tickers: list) -> list:
+    tickers = [ticker.upper() for ticker in tickers]
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT ticker FROM tickers WHERE chat_id = ?", (chat_id,))
+            existing = {row[0] for row in cursor.fetchall()}
+            added = [ticker for ticker in dict.fromkeys(tickers) if ticker not in existing]
+            cursor.executemany("INSERT OR IGNORE INTO tickers (chat_id, ticker) VALUES (?, ?)", [(chat_id, ticker) for ticker in added])
+    finally:
+        conn.close()
+    return added
+
+def remove_tickers(chat_id: int, tickers: list) -> list:
+    tickers = [ticker.upper() for ticker in tickers]
+    conn = sqlite3.connect(DB_PATH)
+    try:
+        with conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT ticker FROM tickers WHERE chat_id = ?", (chat_id,))
+            existing = {row[0] for row in cursor.fetchall()}
+            removed = [ticker for ticker in dict.fromkeys(tickers) if ticker in existing]
+            cursor.executemany("DELETE FROM tickers WHERE chat_id = ? AND ticker = ?", [(chat_id, ticker) for ticker in removed])
+    finally:
+        conn.close()
+    return removed
+
+def get_tracked_tickers(tickers: list) -> set:
+    tickers = [ticker.upper() for ticker in tickers]
+    if not tickers:
+        return set()
+    conn = sqlite3.connect(DB_PATH)
+    cursor = conn.cursor()
+    placeholders = ", ".join("?" for _ in tickers)
+    cursor.execute(f"SELECT DISTINCT ticker FROM tickers WHERE ticker IN ({placeholders})", tickers)
+    tracked = {row[0] for row in cursor.fetchall()}
+    conn.close()
+    return tracked
+
 def get_tickers(chat_id: int) -> list:
     conn = sqlite3.connect(DB_PATH)
     cursor = conn.cursor()
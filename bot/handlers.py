@@ -1,14 +1,23 @@
 import asyncio
 import random
-import time
 from aiogram import Bot, Router, types, html
 from aiogram.filters import Command, CommandStart
 from aiogram.types import InlineKeyboardButton, InlineKeyboardMarkup, BufferedInputFile
 from aiogram.enums import ParseMode, ChatMemberStatus
 from aiogram.filters.callback_data import CallbackData
 from aiogram.dispatcher.middlewares.base import BaseMiddleware
-from .database import add_ticker, remove_ticker, get_tickers
-from .crypto_api import get_current_price, get_crypto_price, subscribe_ticker, unsubscribe_ticker, websocket_manager
+from .database import add_tickers, remove_ticker, remove_tickers, get_tickers, get_tracked_tickers
+from .crypto_api import (
+    get_current_price, get_price_quotes, get_24h_stats, get_klines, render_chart, chart_cache_key, get_chart_file_id, store_chart_file_id,
+    forget_chart_file_id, subscribe_tickers, unsubscribe_ticker, unsubscribe_tickers, websocket_manager,
+    price_source_monitor
+)
+from .jobs import heavy_jobs, QueueBusyError
+from .chat_cache import (
+    get_bot_info, get_chat_admins, get_pinned_message, set_pinned_message, invalidate_pinned_message,
+    invalidate_chat_admins, forget_chat
+)
+from .sessions import ChatSession, SessionScheduler
 from .utils import send_message_with_fallback, edit_message_with_fallback
 
 router = Router()
@@ -16,7 +25,7 @@ router = Router()
 EXEMPT_MESSAGES = [
     "💎 Bot's already running. Wanna /stop it?",
     "💰 Kickin' off crypto tracking...",
-    "📋 Commands:\n\n/start - Kick off tracking\n/stop - Shut it down\n/add ticker - Track a coin\n/remove ticker - Remove a coin\n/chart ticker time - Get a price chart\n/convert value ticker to coin - Swap coins\n/help - This list\n\n📉 - Price dipped\n📈 - Price popped\n\n⚠️ Only Binance coins work!",
+    "📋 Commands:\n\n/start - Kick off tracking\n/stop - Shut it down\n/add ticker ... - Track coins\n/remove ticker ... - Remove coins\n/chart ticker time - Get a price chart\n/convert value ticker to coin - Swap coins\n/help - This list\n\n📉 - Price dipped\n📈 - Price popped\n\n⚠️ Only Binance coins work!",
     "🔥 Yo, I'm here! Hit /help to check my vibe."
 ]
 
@@ -32,7 +41,7 @@ class DeleteMessagesMiddleware(BaseMiddleware):
 class PinCallbackData(CallbackData, prefix="pin"):
     action: str
 
-active_tasks = {}
+BUSY_MESSAGE = "⏳ Bot's busy, try again in a sec."
 
 def normalize_ticker(ticker: str) -> str:
     return 'USDC' if ticker.upper() == 'USDT' else ticker.upper()
@@ -43,112 +52,127 @@ async def is_valid_binance_ticker(ticker: str, currency: str = 'USDC') -> tuple[
         return False, f"Yo, {ticker} ain't on Binance. Try BTC or ETH."
     return True, ""
 
+async def validate_binance_tickers(tickers: list, currency: str = 'USDC') -> tuple[list, list, str]:
+    if not tickers:
+        return [], [], ""
+    prices, error = await get_current_price(tickers, currency)
+    if error:
+        return [], [], error
+    valid = [ticker for ticker in tickers if prices.get(ticker) is not None]
+    invalid = [ticker for ticker in tickers if prices.get(ticker) is None]
+    return valid, invalid, ""
+
 async def is_user_admin(bot: Bot, chat_id: int, user_id: int) -> bool:
     try:
-        member = await bot.get_chat_member(chat_id, user_id)
-        return member.status in [ChatMemberStatus.ADMINISTRATOR, ChatMemberStatus.CREATOR]
+        return user_id in await get_chat_admins(bot, chat_id)
     except Exception:
         return False
 
+def format_volume(volume: float) -> str:
+    for divisor, suffix in ((1e9, 'B'), (1e6, 'M'), (1e3, 'K')):
+        if volume >= divisor:
+            return f"${volume / divisor:.2f}{suffix}"
+    return f"${volume:.2f}"
+
+def format_24h_stats(stats: dict) -> str:
+    return (
+        f"   24h {stats['change_percent']:+.2f}% · "
+        f"H ${stats['high']:.2f} · L ${stats['low']:.2f} · "
+        f"Vol {format_volume(stats['volume'])}"
+    )
+
+async def render_prices(bot: Bot, chat_id: int, message_id: int = None, previous_prices: dict = None):
+    tickers = get_tickers(chat_id)
+    if not tickers:
+        emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
+        message = f"{random.choice(emojis)} No coins tracked. Hit {html.code('/add ticker')} to start."
+        keyboard = InlineKeyboardMarkup(inline_keyboard=[
+            [InlineKeyboardButton(text="📌 Pin", callback_data=PinCallbackData(action="pin_message").pack())]
+        ])
+        if message_id:
+            await edit_message_with_fallback(bot, chat_id, message_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+        else:
+            sent_message = await send_message_with_fallback(bot, chat_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+            message_id = sent_message.message_id
+        return message_id, previous_prices or {}
+    await subscribe_tickers(tickers)
+    quotes, error = await get_price_quotes(tickers, 'USDC')
+    if error:
+        raise Exception(error)
+    prices = {ticker: quote['price'] for ticker, quote in quotes.items()}
+    stats = await get_24h_stats(tickers)
+    previous_prices = previous_prices or {}
+    message_text = []
+    new_prices = {}
+    invalid_tickers = []
+    emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
+    for ticker in tickers:
+        price = prices.get(ticker)
+        if price is None:
+            invalid_tickers.append(ticker)
+            continue
+        prev_price = previous_prices.get(ticker)
+        change_emoji = ""
+        if prev_price is not None:
+            change_percent = ((price - prev_price) / prev_price * 100) if prev_price != 0 else 0
+            if abs(change_percent) == 0:
+                change_emoji = "➡️"
+            elif change_percent > 0:
+                change_emoji = "📈"
+            elif change_percent < 0:
+                change_emoji = "📉"
+        new_prices[ticker] = price
+        price_str = f"${price:.2f}"
+        quote = quotes[ticker]
+        age_str = f" ⏳ {quote['age']:.0f}s old" if quote['stale'] else ""
+        message_text.append(f"{random.choice(emojis)} {html.bold(ticker.upper())}: {price_str} {change_emoji}{age_str}")
+        ticker_stats = stats.get(ticker)
+        if ticker_stats:
+            message_text.append(format_24h_stats(ticker_stats))
+    if not message_text:
+        message_text.append(f"{random.choice(emojis)} No valid coins to show.")
+    for ticker in invalid_tickers:
+        remove_ticker(chat_id, ticker)
+        await unsubscribe_ticker(ticker)
+    message = "\n".join(message_text)
+    keyboard = InlineKeyboardMarkup(inline_keyboard=[
+        [InlineKeyboardButton(text="📌 Pin", callback_data=PinCallbackData(action="pin_message").pack())]
+    ])
+    if message_id:
+        await edit_message_with_fallback(bot, chat_id, message_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+    else:
+        sent_message = await send_message_with_fallback(bot, chat_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
+        message_id = sent_message.message_id
+    return message_id, new_prices
+
 async def update_prices(bot: Bot, chat_id: int, message_id: int = None, previous_prices: dict = None, retries=5, delay=5):
     for attempt in range(retries):
         try:
-            tickers = get_tickers(chat_id)
-            if not tickers:
-                emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
-                message = f"{random.choice(emojis)} No coins tracked. Hit {html.code('/add ticker')} to start."
-                keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                    [InlineKeyboardButton(text="📌 Pin", callback_data=PinCallbackData(action="pin_message").pack())]
-                ])
-                if message_id:
-                    await edit_message_with_fallback(bot, chat_id, message_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
-                else:
-                    sent_message = await send_message_with_fallback(bot, chat_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
-                    message_id = sent_message.message_id
-                return message_id, previous_prices or {}
-            prices, error = await get_current_price(tickers, 'USDC', force_refresh=True)
-            if error:
-                raise Exception(error)
-            previous_prices = previous_prices or {}
-            message_text = []
-            new_prices = {}
-            invalid_tickers = []
-            emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
-            for ticker in tickers:
-                price = prices.get(ticker)
-                if price is None:
-                    invalid_tickers.append(ticker)
-                    continue
-                prev_price = previous_prices.get(ticker)
-                change_emoji = ""
-                if prev_price is not None:
-                    change_percent = ((price - prev_price) / prev_price * 100) if prev_price != 0 else 0
-                    if abs(change_percent) == 0:
-                        change_emoji = "➡️"
-                    elif change_percent > 0:
-                        change_emoji = "📈"
-                    elif change_percent < 0:
-                        change_emoji = "📉"
-                new_prices[ticker] = price
-                price_str = f"${price:.2f}"
-                message_text.append(f"{random.choice(emojis)} {html.bold(ticker.upper())}: {price_str} {change_emoji}")
-            if not message_text:
-                message_text.append(f"{random.choice(emojis)} No valid coins to show.")
-            for ticker in invalid_tickers:
-                remove_ticker(chat_id, ticker)
-                await unsubscribe_ticker(ticker)
-            message = "\n".join(message_text)
-            keyboard = InlineKeyboardMarkup(inline_keyboard=[
-                [InlineKeyboardButton(text="📌 Pin", callback_data=PinCallbackData(action="pin_message").pack())]
-            ])
-            if message_id:
-                await edit_message_with_fallback(bot, chat_id, message_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
-            else:
-                sent_message = await send_message_with_fallback(bot, chat_id, message, reply_markup=keyboard, parse_mode=ParseMode.HTML)
-                message_id = sent_message.message_id
-            return message_id, new_prices
+            return await render_prices(bot, chat_id, message_id, previous_prices)
         except Exception as e:
             if attempt < retries - 1:
                 await asyncio.sleep(delay * (2 ** attempt))
             else:
-                sent_message = await send_message_with_fallback(
-                    bot, chat_id,
-                    f"⚠️ Price update failed after {retries} tries: {str(e)}. Try later.",
-                    parse_mode=ParseMode.HTML
-                )
+                await report_price_failure(bot, chat_id, retries, e)
                 return message_id, previous_prices or {}
     return message_id, previous_prices
 
-async def price_update_task(bot: Bot, chat_id: int, initial_message_id: int = None):
-    if chat_id in active_tasks:
-        active_tasks[chat_id]['task'].cancel()
-        try:
-            await active_tasks[chat_id]['task']
-        except asyncio.CancelledError:
-            pass
-    task = asyncio.current_task()
-    active_tasks[chat_id] = {'task': task, 'message_id': initial_message_id}
-    message_id = initial_message_id
-    previous_prices = {}
-    try:
-        while True:
-            start_time = time.time()
-            result = await update_prices(bot, chat_id, message_id, previous_prices)
-            if result is not None:
-                message_id, previous_prices = result
-                active_tasks[chat_id]['message_id'] = message_id
-            elapsed = time.time() - start_time
-            await asyncio.sleep(max(10 - elapsed, 0))
-    except asyncio.CancelledError:
-        raise
-    except Exception as e:
-        await send_message_with_fallback(
-            bot, chat_id,
-            f"⚠️ Price tracking crashed: {str(e)}. Use /start to restart.",
-            parse_mode=ParseMode.HTML
-        )
-    finally:
-        active_tasks.pop(chat_id, None)
+async def report_price_failure(bot: Bot, chat_id: int, retries: int, error: Exception):
+    await send_message_with_fallback(
+        bot, chat_id,
+        f"⚠️ Price update failed after {retries} tries: {str(error)}. Try later.",
+        parse_mode=ParseMode.HTML
+    )
+
+async def refresh_session(bot: Bot, session: ChatSession):
+    message_id, prices = await render_prices(bot, session.chat_id, session.message_id, session.previous_prices())
+    session.message_id = message_id
+    session.store_prices(prices)
+
+async def report_session_failure(bot: Bot, session: ChatSession, retries: int, error: Exception):
+    await report_price_failure(bot, session.chat_id, retries, error)
+
+chat_sessions = SessionScheduler(refresh_session, report_session_failure)
 
 @router.callback_query(PinCallbackData.filter())
 async def button_callback(callback: types.CallbackQuery, callback_data: PinCallbackData):
@@ -164,21 +188,19 @@ async def button_callback(callback: types.CallbackQuery, callback_data: PinCallb
                 message_id=callback.message.message_id,
                 disable_notification=True
             )
+            from_user = callback.message.from_user
+            set_pinned_message(chat_id, callback.message.message_id, from_user.id if from_user else None)
             await callback.answer("Pinned it!")
         except Exception as e:
             await callback.answer(f"Can't pin: {str(e)}. Check my perms.", show_alert=True)
 
 async def initialize_tickers(bot: Bot, chat_id: int):
     default_tickers = ['SOL', 'ETH', 'BTC']
-    added = []
-    for ticker in default_tickers:
-        is_valid, _ = await is_valid_binance_ticker(ticker, 'USDC')
-        if is_valid:
-            add_ticker(chat_id, ticker)
-            await subscribe_ticker(ticker)
-            added.append(ticker)
+    added, _, _ = await validate_binance_tickers(default_tickers, 'USDC')
     if added:
-        prices, _ = await get_current_price(added, 'USDC', force_refresh=True)
+        add_tickers(chat_id, added)
+        await subscribe_tickers(added)
+        prices, _ = await get_current_price(added, 'USDC')
         if prices and any(price for price in prices.values()):
             message_text = []
             emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
@@ -198,7 +220,7 @@ async def initialize_tickers(bot: Bot, chat_id: int):
 async def start(message: types.Message, bot: Bot):
     chat_id = message.chat.id
     emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖', '🔥', '💎']
-    if chat_id in active_tasks and not active_tasks[chat_id]['task'].done():
+    if chat_sessions.is_active(chat_id):
         await send_message_with_fallback(
             bot, chat_id,
             f"💎 Bot's already running. Wanna /stop it?",
@@ -211,12 +233,14 @@ async def start(message: types.Message, bot: Bot):
         parse_mode=ParseMode.HTML
     )
     try:
-        chat = await bot.get_chat(chat_id)
-        bot_info = await bot.get_me()
-        if chat.pinned_message and chat.pinned_message.from_user and chat.pinned_message.from_user.id == bot_info.id:
+        pinned = await get_pinned_message(bot, chat_id)
+        bot_info = await get_bot_info(bot)
+        if pinned and pinned['from_user_id'] == bot_info.id:
             try:
-                await bot.unpin_chat_message(chat_id=chat_id, message_id=chat.pinned_message.message_id)
+                await bot.unpin_chat_message(chat_id=chat_id, message_id=pinned['message_id'])
+                invalidate_pinned_message(chat_id)
             except Exception as e:
+                invalidate_pinned_message(chat_id)
                 await send_message_with_fallback(
                     bot, chat_id,
                     f"⚠️ Can't unpin old message: {str(e)}. Unpin it yourself or check permissions.",
@@ -229,42 +253,30 @@ async def start(message: types.Message, bot: Bot):
             parse_mode=ParseMode.HTML
         )
     initial_message_id = await initialize_tickers(bot, chat_id)
-    asyncio.create_task(price_update_task(bot, chat_id, initial_message_id))
+    chat_sessions.start(bot, chat_id, initial_message_id)
 
 @router.message(Command('stop'))
 async def stop(message: types.Message, bot: Bot):
     chat_id = message.chat.id
     emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖', '🔥', '💎']
-    if chat_id not in active_tasks:
+    if not chat_sessions.stop(chat_id):
         await send_message_with_fallback(
             bot, chat_id,
             f"{random.choice(emojis)} Ain't trackin' nothin'. Hit /start.",
             parse_mode=ParseMode.HTML
         )
         return
-    active_tasks[chat_id]['task'].cancel()
-    try:
-        await active_tasks[chat_id]['task']
-    except asyncio.CancelledError:
-        pass
-    active_tasks.pop(chat_id, None)
     await send_message_with_fallback(
         bot, chat_id,
         f"🌙 Tracking stopped.",
         parse_mode=ParseMode.HTML
     )
 
-@router.message(lambda message: message.message_id in [active_tasks.get(message.chat.id, {}).get('message_id')])
+@router.message(lambda message: message.message_id == chat_sessions.message_id(message.chat.id))
 async def handle_price_message_delete(message: types.Message, bot: Bot):
     chat_id = message.chat.id
     emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖', '🔥', '💎']
-    if chat_id in active_tasks:
-        active_tasks[chat_id]['task'].cancel()
-        try:
-            await active_tasks[chat_id]['task']
-        except asyncio.CancelledError:
-            pass
-        active_tasks.pop(chat_id, None)
+    if chat_sessions.stop(chat_id):
         await send_message_with_fallback(
             bot, chat_id,
             f"{random.choice(emojis)} Tracking stopped 'cause you deleted the prices.",
@@ -284,38 +296,38 @@ async def add(message: types.Message, bot: Bot):
         )
         return
     args = message.text.split()
-    if len(args) != 2:
+    if len(args) < 2:
         await send_message_with_fallback(
             bot, chat_id,
-            f"📈 Use: {html.code('/add ticker')} (e.g., {html.code('/add BTC')})",
+            f"📈 Use: {html.code('/add ticker ...')} (e.g., {html.code('/add BTC ETH SOL')})",
             parse_mode=ParseMode.HTML
         )
         return
-    ticker = normalize_ticker(args[1])
-    is_valid, error = await is_valid_binance_ticker(ticker, 'USDC')
-    if not is_valid:
-        await send_message_with_fallback(
-            bot, chat_id,
-            f"{random.choice(emojis)} {error}",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    if ticker in get_tickers(chat_id):
-        await send_message_with_fallback(
-            bot, chat_id,
-            f"{random.choice(emojis)} {html.bold(ticker)} already in the list.",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    add_ticker(chat_id, ticker)
-    await subscribe_ticker(ticker)
+    tickers = list(dict.fromkeys(normalize_ticker(arg) for arg in args[1:]))
+    existing = set(get_tickers(chat_id))
+    already = [ticker for ticker in tickers if ticker in existing]
+    candidates = [ticker for ticker in tickers if ticker not in existing]
+    valid, invalid, error = await validate_binance_tickers(candidates, 'USDC')
+    added = add_tickers(chat_id, valid) if valid else []
+    if added:
+        await subscribe_tickers(added)
+    lines = []
+    if added:
+        lines.append(f"✅ Added {', '.join(html.bold(ticker) for ticker in added)}")
+    if already:
+        lines.append(f"{random.choice(emojis)} {', '.join(html.bold(ticker) for ticker in already)} already in the list.")
+    if invalid:
+        lines.append(f"{random.choice(emojis)} Yo, {', '.join(invalid)} ain't on Binance. Try BTC or ETH.")
+    if error:
+        lines.append(f"💥 {error}")
     await send_message_with_fallback(
         bot, chat_id,
-        f"✅ Added {html.bold(ticker)}",
+        "\n".join(lines),
         parse_mode=ParseMode.HTML
     )
-    if chat_id in active_tasks and not active_tasks[chat_id]['task'].done():
-        await update_prices(bot, chat_id, message_id=active_tasks[chat_id]['message_id'], previous_prices={})
+    session = chat_sessions.get(chat_id)
+    if added and session is not None:
+        await update_prices(bot, chat_id, message_id=session.message_id, previous_prices={})
 
 @router.message(Command('remove'))
 async def remove(message: types.Message, bot: Bot):
@@ -330,28 +342,34 @@ async def remove(message: types.Message, bot: Bot):
         )
         return
     args = message.text.split()
-    if len(args) != 2:
+    if len(args) < 2:
         await send_message_with_fallback(
             bot, chat_id,
-            f"📉 Use: {html.code('/remove ticker')} (e.g., {html.code('/remove BTC')})",
+            f"📉 Use: {html.code('/remove ticker ...')} (e.g., {html.code('/remove BTC ETH')})",
             parse_mode=ParseMode.HTML
         )
         return
-    ticker = normalize_ticker(args[1])
-    rows_affected = remove_ticker(chat_id, ticker)
-    if rows_affected > 0:
-        await unsubscribe_ticker(ticker)
-        await send_message_with_fallback(
-            bot, chat_id,
-            f"🗑 Removed {html.bold(ticker)}",
-            parse_mode=ParseMode.HTML
-        )
-    else:
-        await send_message_with_fallback(
-            bot, chat_id,
-            f"💥 {html.bold(ticker)} ain't tracked.",
-            parse_mode=ParseMode.HTML
-        )
+    tickers = list(dict.fromkeys(normalize_ticker(arg) for arg in args[1:]))
+    removed = remove_tickers(chat_id, tickers)
+    missing = [ticker for ticker in tickers if ticker not in removed]
+    if removed:
+        still_tracked = get_tracked_tickers(removed)
+        unused = [ticker for ticker in removed if ticker not in still_tracked]
+        if unused:
+            await unsubscribe_tickers(unused)
+    lines = []
+    if removed:
+        lines.append(f"🗑 Removed {', '.join(html.bold(ticker) for ticker in removed)}")
+    if missing:
+        lines.append(f"💥 {', '.join(html.bold(ticker) for ticker in missing)} ain't tracked.")
+    await send_message_with_fallback(
+        bot, chat_id,
+        "\n".join(lines),
+        parse_mode=ParseMode.HTML
+    )
+    session = chat_sessions.get(chat_id)
+    if removed and session is not None:
+        await update_prices(bot, chat_id, message_id=session.message_id, previous_prices={})
 
 @router.message(Command('chart'))
 async def chart(message: types.Message, bot: Bot):
@@ -366,41 +384,71 @@ async def chart(message: types.Message, bot: Bot):
         return
     ticker = normalize_ticker(args[1])
     time_period = args[2]
+    for force_render in (False, True):
+        try:
+            cache_key, file_id, img_bytes, error = await heavy_jobs.submit(
+                ('chart', ticker, time_period.lower(), force_render), message.from_user.id, message.chat.id,
+                build_chart, ticker, time_period, force_render
+            )
+        except QueueBusyError:
+            await send_message_with_fallback(bot, message.chat.id, BUSY_MESSAGE, parse_mode=ParseMode.HTML)
+            return
+        except Exception as e:
+            error = f"💥 Chart failed: {str(e)}"
+        if error:
+            await send_message_with_fallback(
+                bot, message.chat.id,
+                error,
+                parse_mode=ParseMode.HTML
+            )
+            return
+        if img_bytes is None:
+            file_id = get_chart_file_id(cache_key) or file_id
+            try:
+                await send_chart_photo(bot, message.chat.id, file_id, ticker, time_period)
+                return
+            except Exception:
+                forget_chart_file_id(cache_key)
+                continue
+        photo = BufferedInputFile(img_bytes, filename=f"{ticker}_chart.png")
+        sent_message = await send_chart_photo(bot, message.chat.id, photo, ticker, time_period)
+        if sent_message and sent_message.photo:
+            store_chart_file_id(cache_key, sent_message.photo[-1].file_id)
+        return
+
+async def build_chart(ticker: str, time_period: str, force_render: bool = False):
+    emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
     is_valid, error = await is_valid_binance_ticker(ticker, 'USDC')
     if not is_valid:
-        await send_message_with_fallback(
-            bot, message.chat.id,
-            f"{random.choice(emojis)} {error}",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    img_buffer, error = await get_crypto_price(ticker, time_period, 'USDC')
+        return None, None, None, f"{random.choice(emojis)} {error}"
+    data, error = await get_klines(ticker, time_period, 'USDC')
     if error:
-        await send_message_with_fallback(
-            bot, message.chat.id,
-            f"💥 {error}",
-            parse_mode=ParseMode.HTML
-        )
-        return
+        return None, None, None, f"💥 {error}"
+    cache_key = chart_cache_key(ticker, time_period, data, 'USDC')
+    file_id = None if force_render else get_chart_file_id(cache_key)
+    if file_id:
+        return cache_key, file_id, None, None
+    img_bytes = await asyncio.get_running_loop().run_in_executor(None, render_chart, ticker, time_period, data, 'USDC')
+    return cache_key, None, img_bytes, None
+
+async def send_chart_photo(bot: Bot, chat_id: int, photo, ticker: str, time_period: str) -> types.Message:
+    emojis = ['💸', '🚀', '💰', '🌙', '⭐', '🖖',  '🔥', '💎']
     try:
-        photo = BufferedInputFile(img_buffer.read(), filename=f"{ticker}_chart.png")
-        await bot.send_photo(
-            chat_id=message.chat.id,
+        return await bot.send_photo(
+            chat_id=chat_id,
             photo=photo,
             caption=f"{random.choice(emojis)} {html.bold(ticker.upper())} chart for {time_period}",
             parse_mode=ParseMode.HTML
         )
     except Exception as e:
         if "can't parse entities" in str(e).lower():
-            photo = BufferedInputFile(img_buffer.read(), filename=f"{ticker}_chart.png")
-            await bot.send_photo(
-                chat_id=message.chat.id,
+            return await bot.send_photo(
+                chat_id=chat_id,
                 photo=photo,
                 caption=f"{random.choice(emojis)} {ticker.upper()} chart for {time_period}",
                 parse_mode=None
             )
-        else:
-            raise
+        raise
 
 @router.message(Command('convert'))
 async def convert(message: types.Message, bot: Bot):
@@ -424,24 +472,22 @@ async def convert(message: types.Message, bot: Bot):
             parse_mode=ParseMode.HTML
         )
         return
-    is_valid, error = await is_valid_binance_ticker(source_ticker)
-    if not is_valid:
-        await send_message_with_fallback(
-            bot, message.chat.id,
-            f"{random.choice(emojis)} {error}",
-            parse_mode=ParseMode.HTML
+    try:
+        prices, error = await heavy_jobs.submit(
+            ('convert', source_ticker, target_ticker), message.from_user.id, message.chat.id,
+            lookup_conversion, source_ticker, target_ticker
         )
+    except QueueBusyError:
+        await send_message_with_fallback(bot, message.chat.id, BUSY_MESSAGE, parse_mode=ParseMode.HTML)
         return
-    is_valid, error = await is_valid_binance_ticker(target_ticker)
-    if not is_valid:
+    if error:
         await send_message_with_fallback(
             bot, message.chat.id,
             f"{random.choice(emojis)} {error}",
             parse_mode=ParseMode.HTML
         )
         return
-    prices, error = await get_current_price([source_ticker, target_ticker], 'USDC')
-    if error:
+    if prices is None:
         return
     source_price = prices.get(source_ticker)
     target_price = prices.get(target_ticker)
@@ -466,6 +512,13 @@ async def convert(message: types.Message, bot: Bot):
         parse_mode=ParseMode.HTML
     )
 
+async def lookup_conversion(source_ticker: str, target_ticker: str):
+    prices, error = await get_current_price([source_ticker, target_ticker], 'USDC')
+    for ticker in (source_ticker, target_ticker):
+        if error or prices.get(ticker) is None:
+            return None, f"Yo, {ticker} ain't on Binance. Try BTC or ETH."
+    return prices, None
+
 @router.message(Command('help'))
 async def help_command(message: types.Message, bot: Bot):
     emojis = ['😄', '😄', '😄', '😄', '😄', '😄', '😄', '😄']
@@ -473,8 +526,8 @@ async def help_command(message: types.Message, bot: Bot):
         f"{random.choice(emojis)} Commands:\n\n"
         f"{html.code('/start')} - Kick off tracking\n"
         f"{html.code('/stop')} - Shut it down\n"
-        f"{html.code('/add ticker')} - Track a coin\n"
-        f"{html.code('/remove ticker')} - Remove a coin\n"
+        f"{html.code('/add ticker ...')} - Track coins\n"
+        f"{html.code('/remove ticker ...')} - Remove coins\n"
         f"{html.code('/chart ticker time')} - Get a chart\n"
         f"{html.code('/convert value ticker to coin')} - Swap coins\n"
         f"{html.code('/help')} - This list\n\n"
@@ -490,7 +543,7 @@ async def help_command(message: types.Message, bot: Bot):
 
 @router.message(lambda message: message.new_chat_members)
 async def handle_new_chat_members(message: types.Message, bot: Bot):
-    bot_info = await bot.get_me()
+    bot_info = await get_bot_info(bot)
     if any(member.id == bot_info.id for member in message.new_chat_members):
         await send_message_with_fallback(
             bot, message.chat.id,
@@ -537,13 +590,33 @@ async def unknown_command(message: types.Message, bot: Bot):
     message.video_chat_participants_invited
 ]))
 async def handle_service_message(message: types.Message):
+    if message.pinned_message:
+        pinned_from = message.pinned_message.from_user
+        set_pinned_message(message.chat.id, message.pinned_message.message_id, pinned_from.id if pinned_from else None)
+    if message.left_chat_member:
+        invalidate_chat_admins(message.chat.id)
+    if message.migrate_to_chat_id:
+        forget_chat(message.chat.id)
     try:
         await message.delete()
     except Exception:
         pass
 
-async def start_bot(bot: Bot):
-    asyncio.create_task(websocket_manager())
+@router.chat_member()
+async def handle_chat_member_update(update: types.ChatMemberUpdated):
+    invalidate_chat_admins(update.chat.id)
+
+@router.my_chat_member()
+async def handle_my_chat_member_update(update: types.ChatMemberUpdated):
+    if update.new_chat_member.status in [ChatMemberStatus.LEFT, ChatMemberStatus.KICKED]:
+        chat_sessions.stop(update.chat.id)
+        forget_chat(update.chat.id)
+    else:
+        invalidate_chat_admins(update.chat.id)
+
+async def start_bot(bot: Bot, ws_mode: str = 'ticker'):
+    asyncio.create_task(websocket_manager(ws_mode))
+    asyncio.create_task(price_source_monitor())
 
 async def send_message_with_fallback(bot: Bot, chat_id: int, text: str, parse_mode: ParseMode = None, reply_markup=None) -> types.Message:
     try:
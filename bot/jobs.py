@@ -0,0 +1,78 @@
+import asyncio
+from collections import defaultdict
+
+MAX_QUEUE_SIZE = 32
+MAX_WORKERS = 2
+MAX_JOBS_PER_USER = 1
+MAX_JOBS_PER_CHAT = 3
+
+class QueueBusyError(Exception):
+    pass
+
+class JobQueue:
+    def __init__(self, maxsize: int = MAX_QUEUE_SIZE, workers: int = MAX_WORKERS,
+                 per_user: int = MAX_JOBS_PER_USER, per_chat: int = MAX_JOBS_PER_CHAT):
+        self.maxsize = maxsize
+        self.workers = workers
+        self.per_user = per_user
+        self.per_chat = per_chat
+        self.queue = None
+        self.worker_tasks = []
+        self.in_flight = {}
+        self.user_jobs = defaultdict(int)
+        self.chat_jobs = defaultdict(int)
+
+    def _ensure_workers(self):
+        if self.queue is None:
+            self.queue = asyncio.Queue(maxsize=self.maxsize)
+        self.worker_tasks = [task for task in self.worker_tasks if not task.done()]
+        while len(self.worker_tasks) < self.workers:
+            self.worker_tasks.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        while True:
+            key, func, args, future = await self.queue.get()
+            try:
+                result = await func(*args)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            except BaseException:
+                if not future.done():
+                    future.cancel()
+                raise
+            finally:
+                self.in_flight.pop(key, None)
+                self.queue.task_done()
+
+    def _release(self, user_id: int, chat_id: int):
+        self.user_jobs[user_id] -= 1
+        if self.user_jobs[user_id] <= 0:
+            self.user_jobs.pop(user_id, None)
+        self.chat_jobs[chat_id] -= 1
+        if self.chat_jobs[chat_id] <= 0:
+            self.chat_jobs.pop(chat_id, None)
+
+    async def submit(self, key: tuple, user_id: int, chat_id: int, func, *args):
+        self._ensure_workers()
+        future = self.in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future)
+        if self.user_jobs.get(user_id, 0) >= self.per_user or self.chat_jobs.get(chat_id, 0) >= self.per_chat:
+            raise QueueBusyError("Too many jobs for this user or chat")
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((key, func, args, future))
+        except asyncio.QueueFull:
+            raise QueueBusyError("Job queue is full")
+        self.in_flight[key] = future
+        self.user_jobs[user_id] += 1
+        self.chat_jobs[chat_id] += 1
+        try:
+            return await asyncio.shield(future)
+        finally:
+            self._release(user_id, chat_id)
+
+heavy_jobs = JobQueue()
@@ -0,0 +1,168 @@
+import asyncio
+import math
+import sys
+from array import array
+from time import monotonic
+
+UPDATE_INTERVAL = 10
+TICK = 1.0
+MAX_CONCURRENT_UPDATES = 64
+MAX_RETRIES = 5
+RETRY_DELAY = 5
+
+watchlists = {}
+
+def acquire_watchlist(tickers) -> tuple:
+    key = tuple(sys.intern(ticker) for ticker in tickers)
+    if not key:
+        return ()
+    entry = watchlists.get(key)
+    if entry is None:
+        entry = watchlists[key] = [key, 0]
+    entry[1] += 1
+    return entry[0]
+
+def release_watchlist(tickers: tuple) -> None:
+    entry = watchlists.get(tickers)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del watchlists[tickers]
+
+class ChatSession:
+    __slots__ = ('chat_id', 'message_id', 'slot', 'rounds', 'failures', 'tickers', 'prices')
+
+    def __init__(self, chat_id: int, message_id: int = None, slot: int = 0):
+        self.chat_id = chat_id
+        self.message_id = message_id
+        self.slot = slot
+        self.rounds = 0
+        self.failures = 0
+        self.tickers = ()
+        self.prices = array('d')
+
+    def previous_prices(self) -> dict:
+        return dict(zip(self.tickers, self.prices))
+
+    def store_prices(self, prices: dict) -> None:
+        tickers = acquire_watchlist(prices)
+        release_watchlist(self.tickers)
+        self.tickers = tickers
+        self.prices = array('d', prices.values())
+
+    def release(self) -> None:
+        release_watchlist(self.tickers)
+        self.tickers = ()
+        self.prices = array('d')
+
+class SessionScheduler:
+    def __init__(self, update, on_failure=None, interval: int = UPDATE_INTERVAL, tick: float = TICK,
+                 max_concurrent: int = MAX_CONCURRENT_UPDATES, max_retries: int = MAX_RETRIES,
+                 retry_delay: float = RETRY_DELAY):
+        self.update = update
+        self.on_failure = on_failure
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.interval = interval
+        self.tick = tick
+        self.slots_count = max(int(round(interval / tick)), 1)
+        self.wheel = [set() for _ in range(self.slots_count)]
+        self.sessions = {}
+        self.running = {}
+        self.current_slot = 0
+        self.max_concurrent = max_concurrent
+        self.semaphore = None
+        self.driver = None
+        self.bot = None
+
+    def get(self, chat_id: int):
+        return self.sessions.get(chat_id)
+
+    def is_active(self, chat_id: int) -> bool:
+        return chat_id in self.sessions
+
+    def message_id(self, chat_id: int):
+        session = self.sessions.get(chat_id)
+        return session.message_id if session else None
+
+    def start(self, bot, chat_id: int, message_id: int = None) -> ChatSession:
+        self.stop(chat_id)
+        self.bot = bot
+        if self.semaphore is None:
+            self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        if self.driver is None or self.driver.done():
+            self.driver = asyncio.create_task(self._drive())
+        session = ChatSession(chat_id, message_id, self.current_slot)
+        self.sessions[chat_id] = session
+        self.wheel[session.slot].add(chat_id)
+        self._run(session)
+        return session
+
+    def stop(self, chat_id: int) -> bool:
+        session = self.sessions.pop(chat_id, None)
+        if session is None:
+            return False
+        self.wheel[session.slot].discard(chat_id)
+        session.release()
+        task = self.running.pop(chat_id, None)
+        if task is not None:
+            task.cancel()
+        return True
+
+    def _run(self, session: ChatSession) -> None:
+        if session.chat_id in self.running:
+            return
+        self.running[session.chat_id] = asyncio.create_task(self._update(session))
+
+    async def _update(self, session: ChatSession):
+        try:
+            async with self.semaphore:
+                await self.update(self.bot, session)
+            session.failures = 0
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if self.sessions.get(session.chat_id) is not session:
+                return
+            session.failures += 1
+            if session.failures < self.max_retries:
+                self._reschedule(session, self.retry_delay * (2 ** (session.failures - 1)))
+                return
+            failures, session.failures = session.failures, 0
+            if self.on_failure is not None:
+                try:
+                    await self.on_failure(self.bot, session, failures, e)
+                except Exception:
+                    pass
+        finally:
+            if self.running.get(session.chat_id) is asyncio.current_task():
+                self.running.pop(session.chat_id, None)
+
+    def _reschedule(self, session: ChatSession, delay: float) -> None:
+        ticks = max(math.ceil(delay / self.tick), 1)
+        self.wheel[session.slot].discard(session.chat_id)
+        session.slot = (self.current_slot + ticks) % self.slots_count
+        session.rounds = (ticks - 1) // self.slots_count
+        self.wheel[session.slot].add(session.chat_id)
+
+    async def _drive(self):
+        next_tick = monotonic()
+        while True:
+            next_tick += self.tick
+            await asyncio.sleep(max(next_tick - monotonic(), 0))
+            self.advance()
+
+    def advance(self) -> int:
+        self.current_slot = (self.current_slot + 1) % self.slots_count
+        started = 0
+        for chat_id in tuple(self.wheel[self.current_slot]):
+            session = self.sessions.get(chat_id)
+            if session is None:
+                continue
+            if session.rounds:
+                session.rounds -= 1
+                continue
+            self._run(session)
+            started += 1
+        return started
@@ -0,0 +1,66 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from time import perf_counter
+
+LAG_CHECK_INTERVAL = 0.5
+LAG_THRESHOLD = 0.25
+
+logger = logging.getLogger(__name__)
+
+class LoopWatchdog:
+    def __init__(self, interval: float = LAG_CHECK_INTERVAL, threshold: float = LAG_THRESHOLD):
+        self.interval = interval
+        self.threshold = threshold
+        self.stats = {'last_lag': 0.0, 'max_lag': 0.0, 'stalls': 0}
+        self.heartbeat = perf_counter()
+        self.loop_thread_id = None
+        self.task = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.loop_thread_id = threading.get_ident()
+        self.heartbeat = perf_counter()
+        self.task = asyncio.create_task(self._beat())
+        self.thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.task:
+            self.task.cancel()
+
+    async def _beat(self):
+        while True:
+            expected = perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = perf_counter()
+            lag = max(now - expected, 0.0)
+            self.heartbeat = now
+            self.stats['last_lag'] = lag
+            self.stats['max_lag'] = max(self.stats['max_lag'], lag)
+            if lag > self.threshold:
+                self.stats['stalls'] += 1
+                logger.warning("Event loop lagged %.3fs behind schedule", lag)
+
+    def _watch(self):
+        reported = False
+        while not self.stopped.wait(self.interval):
+            stalled = perf_counter() - self.heartbeat
+            if stalled <= self.interval + self.threshold:
+                reported = False
+                continue
+            if reported:
+                continue
+            reported = True
+            frame = sys._current_frames().get(self.loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "<no frame>"
+            logger.warning("Event loop blocked for %.3fs, current stack:\n%s", stalled, stack)
+
+def start_loop_watchdog(threshold: float = LAG_THRESHOLD, interval: float = LAG_CHECK_INTERVAL) -> LoopWatchdog:
+    watchdog = LoopWatchdog(interval, threshold)
+    watchdog.start()
+    return watchdog
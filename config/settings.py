@@ -13,4 +13,31 @@ def get_db_name():
     db_name = os.getenv('DATABASE_NAME')
     if not db_name:
         raise ValueError("DATABASE_NAME not found in .env file")
-    return db_name
\ No newline at end of file
+    return db_name
+
+def get_ws_mode():
+    load_dotenv()
+    ws_mode = os.getenv('BINANCE_WS_MODE', 'ticker').lower()
+    if ws_mode not in ('ticker', 'miniticker'):
+        raise ValueError("BINANCE_WS_MODE must be 'ticker' or 'miniticker'")
+    return ws_mode
+
+def get_use_uvloop():
+    load_dotenv()
+    return os.getenv('USE_UVLOOP', '').lower() in ('1', 'true', 'yes')
+
+def get_loop_lag_threshold():
+    load_dotenv()
+    threshold = os.getenv('LOOP_LAG_THRESHOLD', '0.25')
+    try:
+        return float(threshold)
+    except ValueError:
+        raise ValueError("LOOP_LAG_THRESHOLD must be a number of seconds")
+
+def get_price_sla():
+    load_dotenv()
+    sla = os.getenv('PRICE_SLA', '15')
+    try:
+        return float(sla)
+    except ValueError:
+        raise ValueError("PRICE_SLA must be a number of seconds")
\ No newline at end of file
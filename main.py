@@ -1,18 +1,29 @@
 import asyncio
+import logging
 from dotenv import load_dotenv
 from aiogram import Bot, Dispatcher
-from bot.handlers import router
+from bot.handlers import router, start_bot
+from bot.crypto_api import set_price_sla
 from bot.database import init_db
-from config.settings import get_token
+from bot.watchdog import start_loop_watchdog
+from config.settings import get_token, get_ws_mode, get_use_uvloop, get_loop_lag_threshold, get_price_sla
 
 async def main():
     load_dotenv()
+    logging.basicConfig(level=logging.INFO)
+    start_loop_watchdog(get_loop_lag_threshold())
     init_db()
+    set_price_sla(get_price_sla())
     token = get_token()
     bot = Bot(token=token)
     dp = Dispatcher()
     dp.include_router(router)
-    await dp.start_polling(bot)
+    await start_bot(bot, get_ws_mode())
+    await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
 
 if __name__ == '__main__':
-    asyncio.run(main())
\ No newline at end of file
+    if get_use_uvloop():
+        import uvloop
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
\ No newline at end of file